@@ -4,8 +4,10 @@ If not, we prompt the user to enter the keys and save them in the environment va
 """
 
 import os
+import shutil
+from functools import lru_cache
 from tkinter import messagebox, simpledialog
-from typing import Optional, Dict, Literal
+from typing import Optional, Dict, List, Literal, Tuple
 
 # Load environment variables from the .env file
 from dotenv import load_dotenv
@@ -13,7 +15,11 @@ from const import EMBASE_KEY, PUBMED_KEY, EMBASE_INST_TOKEN_KEY, VALID_DATABASES
 
 load_dotenv()
 
+# Keys entered by the user as (environment variable, key), written to the .env file by _write_pending_keys
+_pending_env_writes: List[Tuple[str, str]] = []
 
+
+@lru_cache(maxsize=1)
 def get_keys() -> Dict[Optional[str], Optional[str]]:
     """
     Check if the API keys are saved in the environment variables.
@@ -22,12 +28,27 @@ def get_keys() -> Dict[Optional[str], Optional[str]]:
     Returns:
         Dict: A dictionary containing the API keys. If either key is missing it will be None.
     """
-    api_keys = {
-        EMBASE_KEY: os.getenv(EMBASE_KEY),
-        EMBASE_INST_TOKEN_KEY: os.getenv(EMBASE_INST_TOKEN_KEY),
-        PUBMED_KEY: os.getenv(PUBMED_KEY),
-    }
+    # Read the environment once, the result is cached for later callers
+    env = os.environ
+    api_keys = {key: env.get(key) for key in (EMBASE_KEY, EMBASE_INST_TOKEN_KEY, PUBMED_KEY)}
+
+    try:
+        return _prompt_for_missing_keys(api_keys)
+    finally:
+        # Write all the keys the user entered to the .env file at once
+        _write_pending_keys()
+
+
+def _prompt_for_missing_keys(api_keys: Dict[Optional[str], Optional[str]]) -> Dict[Optional[str], Optional[str]]:
+    """
+    Prompt the user to enter any API keys that are missing and save them.
+
+    Args:
+        api_keys (Dict): The API keys found in the environment variables.
 
+    Returns:
+        Dict: The API keys including the ones entered by the user. If either key is missing it will be None.
+    """
     # Check if the keys are saved
     if not api_keys[EMBASE_KEY]:
         # Prompt the user to enter the key using a dialog box
@@ -89,6 +110,7 @@ def get_keys() -> Dict[Optional[str], Optional[str]]:
 def save_keys(key: str, database: Literal["embase", "pubmed", "embase_inst_token"]) -> None:
     """
     Save the API key in the environment variables for a database.
+    The key is written to the .env file once get_keys is done prompting.
 
     Args:
         key (str): The API key to save.
@@ -110,6 +132,40 @@ def save_keys(key: str, database: Literal["embase", "pubmed", "embase_inst_token
     elif database == "embase_inst_token":
         os.environ[EMBASE_INST_TOKEN_KEY] = key
 
-    # Save the environment variables to the .env file
-    with open(".env", "a") as f:
-        f.write(f"{database.upper()}_KEY={key}\n")
+    # Queue the key to be saved to the .env file
+    _pending_env_writes.append((f"{database.upper()}_KEY", key))
+
+
+def _write_pending_keys() -> None:
+    """
+    Save the keys entered by the user to the .env file in a single write.
+    Existing entries for the same keys are replaced instead of duplicated.
+    """
+    if not _pending_env_writes:
+        return
+
+    pending = dict(_pending_env_writes)
+    lines = []
+    if os.path.exists(".env"):
+        with open(".env") as f:
+            for line in f:
+                # Drop old entries for the keys that are being saved
+                if line.split("=", 1)[0].strip() in pending:
+                    continue
+                lines.append(line if line.endswith("\n") else f"{line}\n")
+    lines.extend(f"{name}={key}\n" for name, key in pending.items())
+
+    # Write to a temporary file first so the .env file is replaced atomically
+    # The file holds API keys, create it readable by the owner only and keep the mode of an existing .env
+    try:
+        with os.fdopen(os.open(".env.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            f.writelines(lines)
+        if os.path.exists(".env"):
+            shutil.copymode(".env", ".env.tmp")
+        os.replace(".env.tmp", ".env")
+    except Exception:
+        # Do not leave a copy of the keys behind
+        if os.path.exists(".env.tmp"):
+            os.remove(".env.tmp")
+        raise
+    _pending_env_writes.clear()
@@ -3,16 +3,13 @@ This is the main file of the program. It fires up the UI and manages the interac
 """
 
 import tkinter as tk
-from dotenv import load_dotenv
 from tkinter import simpledialog, messagebox
 
+# Importing key_manager loads the environment variables from the .env file, keep it first
 import key_manager as km
-from search import DBSearcher
+from search import DBSearcher, save_results
 from const import VALID_DATABASES
 
-# Load environment variables from the .env file
-load_dotenv()
-
 # Check if the API keys are saved in the environment variables
 api_keys = km.get_keys()
 print(api_keys)
@@ -27,7 +24,10 @@ dbsearcher = DBSearcher(api_keys)
 # Function to handle button click and display entered data
 def submit():
     user_input = entry.get()
-    result_df = dbsearcher.search(user_input)
+    response = dbsearcher.search(user_input)
+    # Report the databases that could not be searched
+    for database, error in response.errors:
+        messagebox.showerror("DBSearcher: Error", f"Error searching {database}: {error}")
     # Close the dialog box and create a new one asking for a filename to save the results
     # Close the main window
     root.destroy()
@@ -43,7 +43,7 @@ def submit():
     filename = filename.split(".")[0]
 
     # Save the results to a CSV file
-    result_df.to_csv(f"results/{filename}.csv")
+    save_results(response.results, f"results/{filename}.csv")
 
     # Show a message box to the user
     messagebox.showinfo(
@@ -2,18 +2,221 @@
 File that contains a class that will be used to search the relevant database for the user's query.
 """
 
+import csv
 import re
-from functools import reduce
-from tkinter import messagebox
-from typing import Dict, List, Tuple
-from xml.etree import ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
-import requests
-import pandas as pd
+from lxml import etree
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Fall back to the standard library, slower on large responses
+    from json import loads as _json_loads
 
 from config import MAX_RESULTS
 from const import EMBASE_KEY, PUBMED_KEY, EMBASE_INST_TOKEN_KEY
 
+# requests is slow to import, it is imported on the first search so the UI starts faster
+if TYPE_CHECKING:
+    import requests
+
+# Regular expressions used when validating and converting queries, compiled once at import
+# Groups: 1 uppercase operator, 2 operator in any other case, 3 field tag, 4 parenthesis, 5 double quote
+_VALIDATE_RE = re.compile(r'\b(?:(AND|OR|NOT)|((?i:and|or|not)))\b|\[(\w+)\]|([()])|(")')
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+# Matches queries that are already in Embase syntax: quoted terms with optional field suffixes,
+# uppercase operators, parentheses and spaces. Terms and operators must be followed by a space,
+# a parenthesis or the end of the query so e.g. ANDOR is not taken as two operators
+_EMBASE_FORMATTED_RE = re.compile(r"(?:(?:'[^']*'(?::[a-z,]+|/[a-z]+)?|AND|OR|NOT)(?=[() ]|\Z)|[() ])*")
+
+# XPath expressions used to extract PubMed article details, compiled once at import
+# The paths are relative to a PubmedArticle element and avoid searching its whole subtree
+_XP_TITLE = etree.XPath("MedlineCitation/Article/ArticleTitle")
+_XP_ABSTRACT = etree.XPath("MedlineCitation/Article/Abstract")
+# Text results are plain strings, lxml's smart strings would keep the freed article tree alive through their parent
+_XP_FIRST_AUTHOR_LASTNAME = etree.XPath(
+    "MedlineCitation/Article/AuthorList/Author[1]/LastName/text()", smart_strings=False
+)
+_XP_PMID = etree.XPath("MedlineCitation/PMID/text()", smart_strings=False)
+
+# (connect, read) timeout in seconds for the API requests
+_REQUEST_TIMEOUT = (3.05, 30)
+
+# Number of search results kept in memory per DBSearcher, see DBSearcher.search
+_RESULTS_CACHE_SIZE = 16
+
+# Prefix of the link to an article on PubMed, followed by the PubMed ID
+_PUBMED_ARTICLE_URL = "https://pubmed.ncbi.nlm.nih.gov/"
+
+# Field tags accepted in a PubMed query
+_VALID_FIELD_TAGS = frozenset({"tiab", "title", "abstract", "mesh", "mh"})
+
+# Columns of the results CSV file, in the order of the SearchResult fields
+_RESULT_COLUMNS = ("Source", "Author", "Title", "Abstract", "ID", "Link", "Query")
+
+# Field tag mappings from PubMed to Embase
+_FIELD_TAG_MAPPING = {
+    "[Title/Abstract]": ":ti,ab,kw",  # Title/Abstract in PubMed -> Title/Abstract in Embase
+    "[Title]": ":ti,kw",  # Title in PubMed -> Title in Embase
+    "[Abstract]": ":ab,kw",  # Abstract in PubMed -> Abstract in Embase
+    "[Mesh]": "/mj",  # MeSH in PubMed -> Major subject heading in Embase
+    "[mh]": "/mj",  # MeSH Heading -> Major subject heading
+    # Lowercase and short forms of the tags accepted by the query validation
+    "[tiab]": ":ti,ab,kw",
+    "[title]": ":ti,kw",
+    "[abstract]": ":ab,kw",
+    "[mesh]": "/mj",
+}
+
+# Tokenizer that converts a PubMed query to Embase syntax in a single left-to-right scan.
+# Each handler returns the Embase form of the token it matched.
+_EMBASE_SCANNER = re.Scanner(
+    [
+        # Single quoted terms are already in Embase format
+        (r"'[^']*'", lambda scanner, token: token),
+        # Double quoted phrases become lowercased single quoted phrases
+        (r'"[^"]*"', lambda scanner, token: f"'{token[1:-1].strip().lower()}'"),
+        # Field tags are mapped to their Embase equivalent, unknown tags are kept as is
+        (r"\[[^\]]*\]", lambda scanner, token: _FIELD_TAG_MAPPING.get(token, token)),
+        # Boolean operators are uppercased
+        (r"(?i:AND|OR|NOT)\b", lambda scanner, token: token.upper()),
+        (r"[()]", lambda scanner, token: token),
+        # Collapse redundant whitespace
+        (r"\s+", lambda scanner, token: " "),
+        # Any other term gets single quotes
+        (r"\w[\w/*-]*", lambda scanner, token: f"'{token}'"),
+        # Drop stray double quotes and keep any other character
+        (r".", lambda scanner, token: "" if token == '"' else token),
+    ]
+)
+
+
+class SearchResult(NamedTuple):
+    """
+    A single article found in PubMed or Embase.
+    """
+
+    source: str
+    author: str
+    title: str
+    abstract: str
+    id: str
+    link: str
+    query: str
+
+
+class SearchResponse(NamedTuple):
+    """
+    The outcome of DBSearcher.search.
+    """
+
+    results: List[SearchResult]
+    # (database, exception) for each database that could not be searched
+    errors: List[Tuple[str, Exception]]
+
+
+def save_results(results: List[SearchResult], path: str) -> None:
+    """
+    Save search results to a CSV file with a header row.
+
+    Args:
+        results (list): The search results to save.
+        path (str): The path of the CSV file.
+    """
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(_RESULT_COLUMNS)
+        writer.writerows(results)
+
+
+def _normalize(value: Any) -> str:
+    """
+    Normalize a title or author name for deduplication: lowercase with only alphabetical characters.
+
+    Args:
+        value (Any): The title or author name, may be None if it was missing.
+
+    Returns:
+        str: The normalized value, empty if the value is not a string.
+    """
+    return _NON_ALPHA_RE.sub("", value.lower()) if isinstance(value, str) else ""
+
+
+def _dig(obj: Any, *path: Union[str, int], default: Any = None) -> Any:
+    """
+    Walk a nested structure of dicts and lists, returning a default if any step is missing.
+
+    Args:
+        obj (Any): The nested structure, e.g. the Embase json.
+        *path (str | int): The keys and indices to follow.
+        default (Any): The value to return if the path does not exist.
+
+    Returns:
+        Any: The value at the end of the path, or the default.
+    """
+    for step in path:
+        try:
+            obj = obj[step]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return obj
+
+
+@lru_cache(maxsize=256)
+def _is_proper_pubmed_search(query: str) -> bool:
+    """
+    Check if the given PubMed search query is properly formatted.
+
+    Args:
+        query (str): The PubMed search string.
+
+    Returns:
+        bool: True if the query is properly formatted, False otherwise.
+    """
+    # Walk the operators, field tags, parentheses and quotes of the query in a single scan
+    depth = 0
+    quotes = 0
+    for match in _VALIDATE_RE.finditer(query):
+        group = match.lastindex
+        if group == 2:
+            # AND, OR, NOT must be used in uppercase
+            return False
+        elif group == 3 and match.group(3) not in _VALID_FIELD_TAGS:
+            # Field tags must be one of the valid ones (e.g., [tiab], [title], etc.)
+            return False
+        elif group == 4:
+            # Parentheses must be balanced and never closed before they are opened
+            depth += 1 if match.group(4) == "(" else -1
+            if depth < 0:
+                return False
+        elif group == 5:
+            quotes += 1
+
+    # Check for balanced parentheses and quotes
+    return depth == 0 and quotes % 2 == 0
+
+
+@lru_cache(maxsize=256)
+def _convert_pubmed_to_embase(pubmed_query: str) -> str:
+    """
+    Convert a PubMed search query into an Embase-compatible query.
+
+    Args:
+        pubmed_query (str): The search string in PubMed format.
+
+    Returns:
+        str: The search string converted to Embase format.
+    """
+    # Nothing to convert if the query is already in Embase format
+    if _EMBASE_FORMATTED_RE.fullmatch(pubmed_query):
+        return pubmed_query
+
+    embase_tokens, _ = _EMBASE_SCANNER.scan(pubmed_query)
+    return "".join(embase_tokens)
+
 
 class DBSearcher:
     def __init__(self, api_keys: Dict[str, str]) -> None:
@@ -25,115 +228,48 @@ class DBSearcher:
         """
         self.api_key = api_keys
 
-    def __is_proper_pubmed_search(self, query: str) -> bool:
-        """
-        Check if the given PubMed search query is properly formatted.
+        # Created on the first search, see __create_session
+        self._session: Optional["requests.Session"] = None
 
-        Args:
-            query (str): The PubMed search string.
+        # Set once Embase rejects the keys so later searches do not try again
+        self._embase_unauthorized = False
 
-        Returns:
-            bool: True if the query is properly formatted, False otherwise.
-        """
-        # Check for balanced parentheses
-        if query.count("(") != query.count(")"):
-            return False
-
-        # Check for balanced quotes
-        if query.count('"') % 2 != 0:
-            return False
+        # Results of the most recent successful searches, keyed on the query, oldest first
+        self._results_cache: "OrderedDict[str, List[SearchResult]]" = OrderedDict()
 
-        # Ensure that AND, OR, NOT are used in uppercase
-        # We'll use a regular expression to find all operators and check their validity
-        operator_pattern = r"\b(AND|OR|NOT)\b"
-        operators = re.findall(operator_pattern, query, flags=re.IGNORECASE)
-
-        for op in operators:
-            if op != op.upper():
-                return False
-
-        # Check for correct field tag format (e.g., [tiab], [title], etc.)
-        # Here we assume the field tags follow the pattern [<letters>] where letters are lowercase
-        field_tag_pattern = r"\[\w+\]"
-        field_tags = re.findall(field_tag_pattern, query)
-
-        # Ensure that all field tags are valid from this list: tiab, title, abstract, mesh, mh
-        valid_field_tags = {"tiab", "title", "abstract", "mesh", "mh"}
-        if not all(tag[1:-1] in valid_field_tags for tag in field_tags):
-            return False
-
-        for tag in field_tags:
-            if not re.match(r"\[\w+\]", tag):
-                return False
-
-        return True
-
-    def __convert_pubmed_to_embase(self, pubmed_query: str) -> str:
+    def __create_session(self) -> "requests.Session":
         """
-        Convert a PubMed search query into an Embase-compatible query.
-
-        Args:
-            pubmed_query (str): The search string in PubMed format.
+        Create the HTTP session used for all API requests.
+        The session reuses connections to the APIs across requests and retries transient failures.
 
         Returns:
-            str: The search string converted to Embase format.
+            requests.Session: The session to use for the API requests.
         """
-        
-        # Define field tag mappings
-        field_tag_mapping = {
-            "[Title/Abstract]": ":ti,ab,kw",  # Title/Abstract in PubMed -> Title/Abstract in Embase
-            "[Title]": ":ti,kw",  # Title in PubMed -> Title in Embase
-            "[Abstract]": ":ab,kw",  # Abstract in PubMed -> Abstract in Embase
-            "[Mesh]": "/mj",  # MeSH in PubMed -> Major subject heading in Embase
-            "[mh]": "/mj",  # MeSH Heading -> Major subject heading
-        }
-        
-        # Step 1: Apply quotes to unquoted phrases and lowercased terms
-        def add_quotes(match):
-            term = match.group(0).strip()
-            # Ensure lowercase and single quoting
-            return f"'{term.lower()}'" if not term.startswith("'") else term
-        # This pattern finds terms without quotes or field tags
-        embase_query = re.sub(r"(?<!['\"])\\b\\w[\\w\\s/-]+\\b(?!['\"])|\"([^\"]+)\"",
-                            add_quotes, pubmed_query)
-
-        # Step 2: Replace field tags in PubMed format with Embase format
-        for pubmed_tag, embase_tag in field_tag_mapping.items():
-            embase_query = re.sub(re.escape(pubmed_tag), embase_tag, embase_query)
-        
-        # Step 3: Ensure Boolean operators are in uppercase
-        embase_query = re.sub(r"\b(and|or|not)\b", lambda x: x.group(0).upper(), embase_query, flags=re.IGNORECASE)
-        
-        # Step 4: Clean up any redundant spaces and quotes
-        embase_query = re.sub(r"\s+", " ", embase_query)   # Replace multiple spaces with single space
-
-        # Step 5: Add quotes to terms without quotes
-        def remove_strings(string: str, l: List[str]) -> str:
-            return reduce(lambda a, b: a.replace(b, ""), l, string)
-        words_to_quote = remove_strings(embase_query, ["OR", "AND", "NOT", "(", ")"] + list(field_tag_mapping.values())).split("'")
-        # Remove empty spaces in list
-        words_to_quote = [word for word in words_to_quote if word.strip() != ""]
-        # If word not surrounded by single quotes then split by space
-        words_to_quote = [word.split() for word in words_to_quote if word[0] not in ["'", '"'] and word[-1] not in ["'", '"']]
-        # Flatten the list
-        words_to_quote = [word for sublist in words_to_quote for word in sublist]
-        # Add single quotes to each word
-        embase_query = re.sub(r"\b" + r"\b|\b".join(words_to_quote) + r"\b", lambda x: f"'{x.group(0)}'", embase_query)
-
-        # Replace double quotes with single quotes
-        embase_query = re.sub(r'"', "", embase_query)
-        return embase_query
-
-
-    def __search_pubmed(self, query: str):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update({"Accept-Encoding": "gzip"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        session.mount("https://eutils.ncbi.nlm.nih.gov/", adapter)
+        session.mount("https://api.elsevier.com/", adapter)
+        return session
+
+    def __search_pubmed(self, query: str) -> Tuple[str, str, int]:
         """
         Search PubMed using the provided query and API key.
+        The results are kept on the PubMed history server so they can be fetched without sending the IDs back.
 
         Args:
             query (str): The search query for PubMed.
 
         Returns:
-            dict: The search results from PubMed.
+            tuple: (web_env, query_key, count) referencing the search results on the history server.
         """
         pubmed_base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
         params = {
@@ -142,11 +278,17 @@ class DBSearcher:
             "retmode": "json",
             "api_key": self.api_key.get(PUBMED_KEY),
             "retmax": MAX_RESULTS,  # Number of results to return (optional)
+            "usehistory": "y",  # Store the results on the history server
         }
 
-        response = requests.get(pubmed_base_url, params=params)
+        response = self._session.get(pubmed_base_url, params=params, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()  # Raise an error for bad responses
-        return response.json().get("esearchresult", {}).get("idlist", [])
+        search_result = _json_loads(response.content).get("esearchresult", {})
+        return (
+            search_result.get("webenv", ""),
+            search_result.get("querykey", ""),
+            len(search_result.get("idlist", [])),
+        )
 
     def __search_embase(self, query: str) -> dict:
         """
@@ -172,9 +314,12 @@ class DBSearcher:
             "X-ELS-Insttoken": self.api_key.get(EMBASE_INST_TOKEN_KEY),
         }
         
-        response = requests.get(embase_base_url, params=params, headers=headers)
+        response = self._session.get(embase_base_url, params=params, headers=headers, timeout=_REQUEST_TIMEOUT)
 
         # Check for errors in the response
+        if response.status_code in (401, 403):
+            self._embase_unauthorized = True
+
         if response.status_code == 401:
             raise Exception(
                 "Unauthorized: Check your API key and permissions. You may need to get a token for Embase if working off grounds. You can email: integrationsupport@elsevier.com for this."
@@ -185,9 +330,9 @@ class DBSearcher:
             )
         
         response.raise_for_status()  # Raise an error for bad responses
-        return response.json().get("results", {})
+        return _json_loads(response.content).get("results", {})
 
-    def __get_full_title(self, article: ET.Element) -> str:
+    def __get_full_title(self, article: etree._Element) -> str:
         """
         Extract the full title text from an article element.
 
@@ -197,14 +342,14 @@ class DBSearcher:
         Returns:
             str: The full title text of the article.
         """
-        article_title_element = article.find(".//ArticleTitle")
-        if article_title_element is not None:
-            # Use itertext() to get all text including from sub-elements
-            return "".join(article_title_element.itertext()).strip()
+        article_title_elements = _XP_TITLE(article)
+        if article_title_elements:
+            # Serialize as text to get all text including from sub-elements
+            return etree.tostring(article_title_elements[0], method="text", encoding="unicode", with_tail=False).strip()
         else:
             return "No title available"
 
-    def __get_full_abstract(self, article: ET.Element) -> str:
+    def __get_full_abstract(self, article: etree._Element) -> str:
         """
         Extract the full abstract text from an article element.
 
@@ -214,201 +359,205 @@ class DBSearcher:
         Returns:
             str: The full abstract text of the article.
         """
-        abstract_element = article.find(".//Abstract")
-        if abstract_element is not None:
-            # Use itertext() to get all text from the Abstract and its child elements
-            return "".join(abstract_element.itertext()).strip()
+        abstract_elements = _XP_ABSTRACT(article)
+        if abstract_elements:
+            # Serialize as text to get all text from the Abstract and its child elements
+            return etree.tostring(abstract_elements[0], method="text", encoding="unicode", with_tail=False).strip()
         else:
             return "No abstract available"
 
+    def __extract_pubmed_article(self, article: etree._Element, query: str) -> SearchResult:
+        """
+        Extract the details (title, abstract, first author's last name and ID) of a PubMed article.
+
+        Args:
+            article (Element): The PubmedArticle element from the XML tree.
+            query (str): The PubMed query the article was found with.
+
+        Returns:
+            tuple: The result row of the article.
+        """
+        # Get full title and abstract
+        title = self.__get_full_title(article)
+        abstract = self.__get_full_abstract(article)
+
+        # Get first author's last name
+        first_author_lastnames = _XP_FIRST_AUTHOR_LASTNAME(article)
+        first_author_lastname = first_author_lastnames[0] if first_author_lastnames else "No author available"
+
+        # Get the PubMed ID and create the PubMed link
+        pmids = _XP_PMID(article)
+        pmid = pmids[0] if pmids else "No ID available"
+        link = _PUBMED_ARTICLE_URL + pmid + "/" if pmids else "No link available"
+
+        return SearchResult("PubMed", first_author_lastname, title, abstract, pmid, link, query)
+
     def __fetch_pubmed_details(
-        self, pubmed_ids: List[int]
-    ) -> List[Tuple[str, str, str]]:
+        self, web_env: str, query_key: str, count: int, query: str
+    ) -> List[SearchResult]:
         """
-        Fetch details (title, abstract, and first author's last name) from PubMed using the provided IDs.
+        Fetch details (title, abstract, and first author's last name) of PubMed search results from the history server.
 
         Args:
-            pubmed_ids (list): List of PubMed IDs.
-            api_key (str): Your PubMed API key.
+            web_env (str): The WebEnv of the search on the history server.
+            query_key (str): The query key of the search on the history server.
+            count (int): The number of results to fetch.
+            query (str): The PubMed query the results were found with.
 
         Returns:
-            list: List of tuples containing (title, abstract, first_author_last_name) for each article.
+            list: List of result rows, one for each article.
         """
-        if not pubmed_ids:
+        if not count:
             return []
 
         pubmed_base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        ids = ",".join(map(str, pubmed_ids))  # Join IDs into a single string
         params = {
             "db": "pubmed",
-            "id": ids,
+            "WebEnv": web_env,
+            "query_key": query_key,
+            "retmax": count,
             "retmode": "xml",
             "api_key": self.api_key.get(PUBMED_KEY),
         }
 
-        response = requests.get(pubmed_base_url, params=params)
-        response.raise_for_status()
+        with self._session.get(pubmed_base_url, params=params, stream=True, timeout=_REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            # Let urllib3 decompress the gzip body as it is read
+            response.raw.decode_content = True
 
-        root = ET.fromstring(response.content)
-        details = []
+            # Parse the XML while it is downloaded and free each article once its details are extracted
+            rows = []
+            for _, article in etree.iterparse(response.raw, events=("end",), tag="PubmedArticle"):
+                rows.append(self.__extract_pubmed_article(article, query))
+                article.clear()
+                # Also drop the emptied articles before this one from the root
+                while article.getprevious() is not None:
+                    del article.getparent()[0]
 
-        for article in root.findall(".//PubmedArticle"):
-            # Get full title and abstract
-            title = self.__get_full_title(article)
-            abstract = self.__get_full_abstract(article)
+        return rows
 
-            # Get first author's last name
-            first_author_lastname = "No author available"
-            authors = article.findall(".//Author")
-            if authors and authors[0].find(".//LastName") is not None:
-                first_author_lastname = authors[0].find(".//LastName").text
-
-            # Append title, abstract, and first author's last name
-            details.append((title, abstract, first_author_lastname))
-
-        return details
-
-    def __fetch_embase_details(self, data: dict) -> Tuple[str, str, str]:
+    def __fetch_embase_details(self, data: dict, query: str) -> SearchResult:
         """
         Fetch details (title, abstract, and first author's last name) from a specific Embase document.
 
         Args:
             data (dict): The Embase json.
+            query (str): The Embase query the document was found with.
 
         Returns:
-            tuple: (title, abstract, first_author_last_name) of the document.
+            tuple: The result row of the document.
         """
         head = data.get("head", {})
-        title = head.get("citationTitle", {}).get("titleText", {})[0].get("ttltext", "No title available")
-        try:
-            abstract = head.get("abstracts", {}).get("abstracts", {})[0].get("paras", "No abstract available")
-            abstract = " ".join(abstract)
-        except KeyError:
-            abstract = "No abstract available"
-        except IndexError:
-            abstract = "No abstract available"
-        try:
-            first_author_lastname = head.get("authorList", {}).get("authors", {})[0].get("surname", "No author available")
-        except IndexError:
-            first_author_lastname = "No author available"
-        except KeyError:
-            first_author_lastname = "No author available"
-        link = data.get("itemInfo", {}).get("itemIdList", {}).get("doi", "No link available")
-        id = data.get("itemInfo", {}).get("itemIdList", {}).get("medl", "No ID available")
+        title = _dig(head, "citationTitle", "titleText", 0, "ttltext", default="No title available")
+        abstract = _dig(head, "abstracts", "abstracts", 0, "paras")
+        abstract = " ".join(abstract) if abstract else "No abstract available"
+        first_author_lastname = _dig(head, "authorList", "authors", 0, "surname", default="No author available")
+        link = _dig(data, "itemInfo", "itemIdList", "doi", default="No link available")
+        id = _dig(data, "itemInfo", "itemIdList", "medl", default="No ID available")
 
         if link == "No link available" and id != "No ID available":
-            link = f"https://pubmed.ncbi.nlm.nih.gov/{id}/"
+            link = _PUBMED_ARTICLE_URL + str(id) + "/"
 
-        return id, title, abstract, first_author_lastname, link
+        return SearchResult("Embase", first_author_lastname, title, abstract, id, link, query)
 
-    def search(self, query: str) -> pd.DataFrame:
+    def __run_pubmed(self, query: str) -> List[SearchResult]:
         """
-        Search both PubMed and Embase using the provided query
-        and return the results in a Pandas DataFrame.
+        Search PubMed and fetch the details of the articles found.
 
         Args:
-            query (str): The search query.
+            query (str): The search query for PubMed.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the search results.
+            list: List of result rows, one for each article.
         """
-        # Check that the query is in the proper format for PubMed
-        if not self.__is_proper_pubmed_search(query):
-            # Show an error messagebox
-            messagebox.showerror(
-                "DBSearcher: Error",
-                "The search query is not properly formatted for PubMed.",
-            )
-            return pd.DataFrame()
+        web_env, query_key, count = self.__search_pubmed(query)
+        return self.__fetch_pubmed_details(web_env, query_key, count, query)
 
-        # Search PubMed
-        try:
-            pubmed_ids = self.__search_pubmed(query)
-            pubmed_details = self.__fetch_pubmed_details(pubmed_ids)
-        except Exception as e:
-            # Show an error messagebox
-            messagebox.showerror("DBSearcher: Error", f"Error searching PubMed: {e}")
-            pubmed_ids = []
-            pubmed_details = []
-
-        # Convert the PubMed query to Embase format
-        embase_query = self.__convert_pubmed_to_embase(query)
-
-        # Search Embase
-        try:
-            embase_results = self.__search_embase(embase_query)
-            embase_details = [
-                self.__fetch_embase_details(doc) for doc in embase_results
-            ]
-        except Exception as e:
-            # Show an error messagebox
-            messagebox.showerror("DBSearcher: Error", f"Error searching Embase: {e}")
-            embase_results = []
-            embase_details = []
-
-        # Create a DataFrame to hold the results
-        results_data = {
-            "Source": [],
-            "Author": [],
-            "Title": [],
-            "Abstract": [],
-            "ID": [],
-            "Link": [],
-            "Query": [],
-        }
+    def __run_embase(self, query: str) -> List[SearchResult]:
+        """
+        Search Embase and extract the details of the documents found.
 
-        # Add PubMed results to the DataFrame
-        for i, pmid in enumerate(pubmed_ids):
-            results_data["Source"].append("PubMed")
-
-            # Extract title, abstract, and author from PubMed details
-            title, abstract, author_lastname = (
-                pubmed_details[i]
-                if i < len(pubmed_details)
-                else (
-                    "No title available",
-                    "No abstract available",
-                    "No author available",
-                )
-            )
+        Args:
+            query (str): The search query in Embase format.
 
-            results_data["Title"].append(title)
-            results_data["Abstract"].append(abstract)
-            results_data["Author"].append(author_lastname)
-            results_data["ID"].append(pmid)
-            results_data["Link"].append(
-                f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/"
-            )  # Create PubMed link
-            # Add the query to the DataFrame
-            results_data["Query"].append(query)
-
-        # Add Embase results to the DataFrame
-        for i, doc in enumerate(embase_results):
-            # Extract title, abstract, and author from Embase details
-            id, title, abstract, author_lastname, link = embase_details[i]
-
-            results_data["Source"].append("Embase")
-            results_data["Title"].append(title)
-            results_data["Abstract"].append(abstract)
-            results_data["Author"].append(author_lastname)
-            results_data["ID"].append(id)
-            results_data["Link"].append(link) 
-            results_data["Query"].append(embase_query)
-
-        # Create and return the DataFrame
-        results_df = pd.DataFrame(results_data)
+        Returns:
+            list: List of result rows, one for each document.
+        """
+        return [self.__fetch_embase_details(doc, query) for doc in self.__search_embase(query)]
 
-        # Based on: lowercase title with only alphabetical characters and last name with lower case
-        # If redundant rows are found, keep the first one
-        # Drop duplicates by normalizing the "Title" and "Author" columns to lowercase and removing non-alphabetical characters
-        # Create normalized columns for Title and Author
-        results_df['Normalized_Title'] = results_df['Title'].str.lower().str.replace(r'[^a-z]', '', regex=True)
-        results_df['Normalized_Author'] = results_df['Author'].str.lower().str.replace(r'[^a-z]', '', regex=True)
+    def search(self, query: str) -> SearchResponse:
+        """
+        Search both PubMed and Embase using the provided query
+        and return the unique results.
+        Errors are returned instead of shown so the caller decides how to report them.
 
-        # Drop duplicates based on these normalized columns, keeping the first occurrence
-        results_df = results_df.drop_duplicates(subset=['Normalized_Title', 'Normalized_Author'], keep='first')
+        Args:
+            query (str): The search query.
 
-        # Drop the temporary normalized columns after deduplication
-        results_df = results_df.drop(columns=['Normalized_Title', 'Normalized_Author'])
+        Returns:
+            SearchResponse: The search results, see save_results to write them to a CSV file,
+            and the errors of the databases that could not be searched.
+        """
+        # Check that the query is in the proper format for PubMed
+        if not _is_proper_pubmed_search(query):
+            return SearchResponse([], [("PubMed", ValueError("The search query is not properly formatted for PubMed."))])
+
+        # Reuse the results of an identical search from earlier in the session
+        if query in self._results_cache:
+            self._results_cache.move_to_end(query)
+            return SearchResponse(list(self._results_cache[query]), [])
+
+        # Create the session here so both search threads share it
+        if self._session is None:
+            self._session = self.__create_session()
+
+        # Only search Embase if we have its keys and they have not been rejected already
+        search_embase = (
+            bool(self.api_key.get(EMBASE_KEY) and self.api_key.get(EMBASE_INST_TOKEN_KEY))
+            and not self._embase_unauthorized
+        )
+
+        # Search PubMed and Embase at the same time, both are network bound
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pubmed_future = executor.submit(self.__run_pubmed, query)
+            if search_embase:
+                # Convert the PubMed query to Embase format
+                embase_future = executor.submit(self.__run_embase, _convert_pubmed_to_embase(query))
+
+            # Errors are raised by result(), collect them with the database they came from
+            errors = []
+            try:
+                pubmed_rows = pubmed_future.result()
+            except Exception as e:
+                errors.append(("PubMed", e))
+                pubmed_rows = []
+
+            embase_rows = []
+            if search_embase:
+                try:
+                    embase_rows = embase_future.result()
+                except Exception as e:
+                    errors.append(("Embase", e))
+            elif self._embase_unauthorized:
+                # Report the skipped search so the results are not taken, or cached, as complete
+                errors.append(("Embase", Exception("Skipped, the Embase API key was rejected by an earlier search.")))
+            else:
+                errors.append(("Embase", Exception("Skipped, the Embase API key or institution token is missing.")))
 
-        return results_df
+        # Based on: lowercase title with only alphabetical characters and last name with lower case
+        # If redundant results are found, keep the first one
+        results = []
+        seen = set()
+        for result in pubmed_rows + embase_rows:
+            key = (_normalize(result.title), _normalize(result.author))
+            if key not in seen:
+                seen.add(key)
+                results.append(result)
+
+        # Only cache complete results so a failed search is tried again
+        if not errors:
+            self._results_cache[query] = list(results)
+            if len(self._results_cache) > _RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
+
+        return SearchResponse(results, errors)